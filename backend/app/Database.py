@@ -45,6 +45,7 @@ def init_db():
         # Import models here to avoid circular imports
         from model.account_database import Accounts  # noqa: F401
         from model.review_database import Reviews    # noqa: F401
+        from model.review_fingerprint import ReviewFingerprints  # noqa: F401
 
         # Create all tables
         Base.metadata.create_all(bind=engine)
@@ -56,7 +57,7 @@ def init_db():
         logger.info(f"Available tables: {tables}")
         
         # Verify expected tables exist
-        expected_tables = {'accounts', 'reviews'}
+        expected_tables = {'accounts', 'reviews', 'review_fingerprints'}
         actual_tables = set(tables)
         
         if not expected_tables.issubset(actual_tables):
@@ -69,4 +70,4 @@ def init_db():
         
     except Exception as e:
         logger.error(f"Database initialization failed: {e}", exc_info=True)
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,24 @@
+import os
+import tempfile
+import pytest
+
+# Database.py needs DATABASE_URL at import time; tests use a throwaway SQLite file
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+
+
+@pytest.fixture
+def db():
+    """A session on freshly created tables, emptied again after the test."""
+    pytest.importorskip("sqlalchemy")
+    from Database import Base, SessionLocal, engine
+    from model import Accounts, Reviews, ReviewFingerprints  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
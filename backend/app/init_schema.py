@@ -0,0 +1,8 @@
+# init_schema.py
+# Create/verify the database schema once per deployment, before starting the API workers:
+#   python init_schema.py && uvicorn main:app
+import sys
+from Database import init_db
+
+if __name__ == "__main__":
+    sys.exit(0 if init_db() else 1)
@@ -1,13 +1,19 @@
 from fastapi import FastAPI, Depends, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from auth.auth import router as auth_router, GetCurrentUser
-from review.gemini_review import gemini_code_review
+from review.gemini_review import gemini_code_review, NO_ISSUES_FOUND
 from review.review_logic import run_flake8
+from review.review_export import router as export_router
+from review.fingerprint import (
+    fingerprint_code, remap_findings, changed_ranges, findings_in_ranges, REUSE_THRESHOLD, REUSE_CANDIDATES
+)
 from model.review_database import Reviews
+from model.review_setting import find_reusable_review, add_fingerprint
 from Database import get_db, init_db
 from datetime import datetime
 import logging
 import asyncio
+import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,11 +31,19 @@ app.add_middleware(
 )
 
 app.include_router(auth_router)
+app.include_router(export_router)
+
+# Schema creation/verification runs once per deployment (`python init_schema.py`
+# before starting the server), not in every worker. Set INIT_DB_ON_STARTUP=true
+# to run it in the app process instead.
+INIT_DB_ON_STARTUP = os.getenv("INIT_DB_ON_STARTUP", "false").lower() in ("1", "true", "yes")
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database on startup if enabled"""
+    if not INIT_DB_ON_STARTUP:
+        return
     if init_db():
         logger.info("Database initialized successfully")
     else:
@@ -54,9 +68,27 @@ async def review_code(
         static_results = run_flake8(code)
         logger.info("Static analysis completed")
 
-        # Get AI review
-        ai_results = gemini_code_review(code, static_results)
-        logger.info("AI review completed")
+        # Reuse an earlier AI review if the upload is structurally the same
+        fingerprint = fingerprint_code(code)
+        reused = find_reusable_review(db, current_user, fingerprint, REUSE_THRESHOLD, REUSE_CANDIDATES)
+        if reused:
+            previous_review, previous_findings, similarity_score = reused
+            ai_results = remap_findings(previous_findings, previous_review.code, code)
+            logger.info(f"Reused AI review {previous_review.id} (similarity {similarity_score:.2f})")
+
+            # Units that changed since the earlier upload still get a fresh AI review,
+            # with the whole module as context so imports and globals are visible
+            ranges = changed_ranges(previous_review.code, code)
+            if ranges:
+                ai_results += findings_in_ranges(gemini_code_review(code, static_results, ranges), ranges)
+                logger.info("AI review of changed units completed")
+
+            ai_results = [item for item in ai_results if item != NO_ISSUES_FOUND] or [dict(NO_ISSUES_FOUND)]
+        else:
+            previous_review, similarity_score = None, None
+            # Get AI review
+            ai_results = gemini_code_review(code, static_results)
+            logger.info("AI review completed")
 
         # Save review to database
         review_entry = Reviews(
@@ -67,6 +99,8 @@ async def review_code(
             created_at=datetime.utcnow()
         )
         db.add(review_entry)
+        db.flush()  # assigns review_entry.id for the fingerprint row
+        add_fingerprint(db, review_entry.id, current_user, fingerprint)
         db.commit()
         db.refresh(review_entry)
         logger.info(f"Review saved with ID: {review_entry.id}")
@@ -75,7 +109,10 @@ async def review_code(
             "user": current_user,
             "review_id": review_entry.id,
             "static_result": static_results,
-            "ai_result": ai_results
+            "ai_result": ai_results,
+            "ai_reused": previous_review is not None,
+            "reused_from_review_id": previous_review.id if previous_review else None,
+            "similarity": similarity_score
         }
 
     except asyncio.TimeoutError:
@@ -91,4 +128,5 @@ async def review_code(
 
 if __name__ == "__main__":
     import uvicorn
+    init_db()
     uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
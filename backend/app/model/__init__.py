@@ -1,4 +1,5 @@
 from .account_database import Accounts
 from .review_database import Reviews
+from .review_fingerprint import ReviewFingerprints
 
-__all__ = ['Accounts', 'Reviews']
\ No newline at end of file
+__all__ = ['Accounts', 'Reviews', 'ReviewFingerprints']
\ No newline at end of file
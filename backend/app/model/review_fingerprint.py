@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from Database import Base
+
+class ReviewFingerprints(Base):
+    __tablename__ = "review_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    review_id = Column(Integer, ForeignKey("reviews.id", ondelete="CASCADE"), index=True, nullable=False)
+    email = Column(String, index=True, nullable=False)
+    module_hash = Column(String(64), index=True, nullable=False)
+    unit_hashes = Column(String, nullable=False)  # JSON list of per-unit hashes
\ No newline at end of file
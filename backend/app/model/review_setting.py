@@ -1,6 +1,10 @@
 # review_setting.py
+import ast
+import json
 from sqlalchemy.orm import Session
 from model.review_database import Reviews
+from model.review_fingerprint import ReviewFingerprints
+from review.fingerprint import similarity
 from Database import SessionLocal
 
 def save_review(email: str, code: str, static_result: str, ai_result: str):
@@ -21,4 +25,77 @@ def save_review(email: str, code: str, static_result: str, ai_result: str):
         db.rollback()
         return {"error": f"Failed to save review: {e}"}
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def find_reusable_review(db: Session, email: str, fingerprint: dict, threshold: float, max_candidates: int):
+    """
+    Find an earlier review by the same user whose code is structurally similar enough
+    to reuse its AI findings. Returns (review, findings, similarity) or None.
+    """
+    if not fingerprint:
+        return None
+
+    # Exact structural matches first, then the most recent fingerprints if partial reuse is enabled.
+    candidates = (
+        db.query(ReviewFingerprints)
+        .filter(ReviewFingerprints.email == email, ReviewFingerprints.module_hash == fingerprint["module_hash"])
+        .order_by(ReviewFingerprints.id.desc())
+        .limit(max_candidates)
+        .all()
+    )
+    if threshold < 1.0:
+        candidates += (
+            db.query(ReviewFingerprints)
+            .filter(ReviewFingerprints.email == email)
+            .order_by(ReviewFingerprints.id.desc())
+            .limit(max_candidates)
+            .all()
+        )
+
+    best = None
+    for candidate in candidates:
+        if candidate.module_hash == fingerprint["module_hash"]:
+            score = 1.0
+        else:
+            score = similarity(json.loads(candidate.unit_hashes), fingerprint["unit_hashes"])
+        if score < threshold or (best and score <= best[1]):
+            continue
+        review = db.query(Reviews).filter(Reviews.id == candidate.review_id).first()
+        findings = _stored_findings(review)
+        if findings is None:
+            continue
+        best = (review, score, findings)
+        if score == 1.0:
+            break
+
+    if best is None:
+        return None
+    review, score, findings = best
+    return review, findings, score
+
+
+def _stored_findings(review):
+    """Parse the AI findings saved with a review; None if they are missing or came from a failed run."""
+    if review is None or not review.ai_result:
+        return None
+    try:
+        findings = ast.literal_eval(review.ai_result)
+    except (ValueError, SyntaxError):
+        return None
+    if not isinstance(findings, list):
+        return None
+    if any(isinstance(item, dict) and item.get("category") == "Error" for item in findings):
+        return None
+    return [item for item in findings if isinstance(item, dict)]
+
+
+def add_fingerprint(db: Session, review_id: int, email: str, fingerprint: dict):
+    """Index a review by its structural fingerprint; committed with the caller's transaction."""
+    if not fingerprint:
+        return
+    db.add(ReviewFingerprints(
+        review_id=review_id,
+        email=email,
+        module_hash=fingerprint["module_hash"],
+        unit_hashes=json.dumps(fingerprint["unit_hashes"]),
+    ))
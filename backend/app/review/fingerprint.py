@@ -0,0 +1,197 @@
+import ast
+import hashlib
+import json
+import os
+import re
+
+# Minimum share of matching top-level units for an earlier review to be reused.
+# 1.0 only reuses structurally identical modules; lower values also accept
+# uploads where some functions/classes changed (only those get a fresh AI review).
+REUSE_THRESHOLD = float(os.getenv("REVIEW_REUSE_THRESHOLD", "1.0"))
+if not 0 < REUSE_THRESHOLD <= 1:
+    raise RuntimeError("REVIEW_REUSE_THRESHOLD must be greater than 0 and at most 1")
+
+# How many of the user's most recent fingerprints to compare when there is
+# no exact module match.
+REUSE_CANDIDATES = int(os.getenv("REVIEW_REUSE_CANDIDATES", "50"))
+
+# Line numbers inside a finding's "line", e.g. 5, "5-6", "Line 10" or "10, 11"
+LINE_NUMBER = re.compile(r"\d+")
+
+
+def _unit_hash(node: ast.AST) -> str:
+    # ast.dump without attributes ignores positions, so whitespace, comments
+    # and formatting changes do not affect the hash.
+    dump = ast.dump(node, annotate_fields=True, include_attributes=False)
+    return hashlib.sha256(dump.encode("utf-8")).hexdigest()
+
+
+def _units(tree: ast.Module) -> list:
+    """Top-level units of a module: one per statement, each import name on its own."""
+    units = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                units.append(ast.Import(names=[alias]))
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                units.append(ast.ImportFrom(module=node.module, names=[alias], level=node.level))
+        else:
+            units.append(node)
+    return units
+
+
+def fingerprint_code(code: str) -> dict | None:
+    """
+    Build a structural fingerprint of a Python module.
+    Returns {"module_hash": str, "unit_hashes": [str, ...]} or None if the code does not parse.
+    """
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        return None
+
+    units = _units(tree)
+    unit_hashes = [_unit_hash(unit) for unit in units]
+    # Imports are order-insensitive; everything else keeps its source order.
+    is_import = [isinstance(unit, (ast.Import, ast.ImportFrom)) for unit in units]
+    imports = sorted(h for h, flag in zip(unit_hashes, is_import) if flag)
+    others = [h for h, flag in zip(unit_hashes, is_import) if not flag]
+    module_hash = hashlib.sha256(json.dumps(imports + others).encode("utf-8")).hexdigest()
+
+    return {"module_hash": module_hash, "unit_hashes": unit_hashes}
+
+
+def similarity(old_hashes: list, new_hashes: list) -> float:
+    """Share of top-level units the two modules have in common (multiset match)."""
+    if not old_hashes and not new_hashes:
+        return 1.0
+    remaining = list(old_hashes)
+    matched = 0
+    for h in new_hashes:
+        if h in remaining:
+            remaining.remove(h)
+            matched += 1
+    return matched / max(len(old_hashes), len(new_hashes))
+
+
+def _positioned_units(tree: ast.Module):
+    """Yield (hashable unit, node carrying source positions) pairs."""
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for unit in _units(ast.Module(body=[node], type_ignores=[])):
+                yield unit, node
+        else:
+            yield node, node
+
+
+def _pair_units(old_tree: ast.Module, new_tree: ast.Module) -> tuple:
+    """
+    Pair structurally identical top-level units of two modules.
+    Returns (pairs, unmatched_new) as lists of position-carrying nodes.
+    """
+    old_by_hash = {}
+    for unit, original in _positioned_units(old_tree):
+        old_by_hash.setdefault(_unit_hash(unit), []).append(original)
+
+    pairs = []
+    unmatched_new = []
+    for unit, original in _positioned_units(new_tree):
+        candidates = old_by_hash.get(_unit_hash(unit))
+        if candidates:
+            pairs.append((candidates.pop(0), original))
+        elif original not in unmatched_new:
+            unmatched_new.append(original)
+    return pairs, unmatched_new
+
+
+def _span(node: ast.AST) -> tuple:
+    """First and last source line of a statement, decorators included."""
+    start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+    return start, node.end_lineno or node.lineno
+
+
+def _span_pairs(old_code: str, new_code: str) -> list:
+    """
+    (old_span, new_span) line spans of corresponding AST nodes in structurally
+    identical top-level units; spans of changed units are absent.
+    """
+    pairs, _ = _pair_units(ast.parse(old_code), ast.parse(new_code))
+
+    span_pairs = []
+    for original, target in pairs:
+        span_pairs.append((_span(original), _span(target)))
+        # Identical dumps walk in the same order, so nodes pair up one to one.
+        for old_node, new_node in zip(ast.walk(original), ast.walk(target)):
+            if getattr(old_node, "lineno", None) is None or getattr(new_node, "lineno", None) is None:
+                continue
+            span_pairs.append((
+                (old_node.lineno, old_node.end_lineno or old_node.lineno),
+                (new_node.lineno, new_node.end_lineno or new_node.lineno),
+            ))
+    return span_pairs
+
+
+def _map_findings(findings: list, map_line) -> list:
+    """
+    Apply map_line to every line number a finding references, keeping the value's shape.
+    Values without digits (such as "N/A") pass through; findings with an unmappable line are dropped.
+    """
+    mapped = []
+    for item in findings:
+        line = item.get("line", "N/A")
+        text = str(line)
+        numbers = [int(n) for n in LINE_NUMBER.findall(text)] if not isinstance(line, bool) else []
+        if not numbers:
+            mapped.append(dict(item))
+            continue
+        new_numbers = [map_line(n) for n in numbers]
+        if None in new_numbers:
+            continue
+        if isinstance(line, int) or text.strip().isdigit():
+            new_line = new_numbers[0]
+        else:
+            replacements = iter(new_numbers)
+            new_line = LINE_NUMBER.sub(lambda _: str(next(replacements)), text)
+        mapped.append({**item, "line": new_line})
+    return mapped
+
+
+def remap_findings(findings: list, old_code: str, new_code: str) -> list:
+    """
+    Carry review items from an earlier upload over to a new one.
+    Items pointing into units that changed are dropped, since they may no longer apply.
+    """
+    try:
+        span_pairs = _span_pairs(old_code, new_code)
+    except (SyntaxError, ValueError):
+        return []
+
+    def map_line(old_line):
+        containing = [pair for pair in span_pairs if pair[0][0] <= old_line <= pair[0][1]]
+        if not containing:
+            return None
+        # The innermost node holding the line decides where it goes; lines inside it
+        # (comments, continuations) keep their offset but never leave its new span,
+        # so a collapsed multi-line statement still points at itself.
+        (old_start, _), (new_start, new_end) = min(containing, key=lambda pair: (pair[0][1] - pair[0][0], -pair[0][0]))
+        return min(new_start + (old_line - old_start), new_end)
+
+    return _map_findings(findings, map_line)
+
+
+def changed_ranges(old_code: str, new_code: str) -> list:
+    """(start, end) line spans of the new module's top-level units with no identical unit in the old one."""
+    try:
+        _, unmatched = _pair_units(ast.parse(old_code), ast.parse(new_code))
+    except (SyntaxError, ValueError):
+        return []
+    return sorted(_span(node) for node in unmatched)
+
+
+def findings_in_ranges(findings: list, ranges: list) -> list:
+    """Keep review items whose lines all fall inside ranges; items without a line are kept."""
+    def map_line(line):
+        return line if any(start <= line <= end for start, end in ranges) else None
+
+    return _map_findings(findings, map_line)
@@ -1,7 +1,7 @@
-import google.generativeai as genai
 import os
 import json
 import logging
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,19 +10,51 @@ logger = logging.getLogger(__name__)
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
     logger.warning("GEMINI_API_KEY not found in .env file")
-else:
+
+# Preferred model first, then the fallback
+MODEL_NAMES = ['gemini-pro-latest', 'gemini-pro']
+
+# Returned when the AI reports no issues
+NO_ISSUES_FOUND = {
+    "category": "Info",
+    "line": "N/A",
+    "message": "No issues found",
+    "suggestion": "Code looks good!"
+}
+
+
+@lru_cache(maxsize=1)
+def get_genai():
+    """Import and configure the Gemini SDK on first use; it is slow to import."""
+    import google.generativeai as genai
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai
+
+
+@lru_cache(maxsize=1)
+def available_models() -> frozenset:
+    """Model names offered to this API key, discovered once per process (network call)."""
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        # List available models for debugging
-        for m in genai.list_models():
-            logger.info(f"Available model: {m.name}")
+        names = frozenset(m.name.removeprefix("models/") for m in get_genai().list_models())
+        logger.debug(f"Available models: {sorted(names)}")
+        return names
     except Exception as e:
-        logger.warning(f"Gemini configuration failed: {e}")
+        logger.warning(f"Gemini model discovery failed: {e}")
+        return frozenset()
+
 
+def candidate_models() -> list:
+    """MODEL_NAMES ordered by availability; unknown availability keeps the default order."""
+    names = available_models()
+    if not names:
+        return list(MODEL_NAMES)
+    return [m for m in MODEL_NAMES if m in names] + [m for m in MODEL_NAMES if m not in names]
 
-def gemini_code_review(code: str, static_results: str = "") -> list:
+
+def gemini_code_review(code: str, static_results: str = "", focus_ranges: list | None = None) -> list:
     """
     Perform AI-powered code review using Gemini API.
+    focus_ranges limits the review to (start, end) line spans; the rest of the code is context only.
     Returns a list of review items.
     """
     if not GEMINI_API_KEY:
@@ -34,6 +66,12 @@ def gemini_code_review(code: str, static_results: str = "") -> list:
         }]
 
     try:
+        focus = ""
+        if focus_ranges:
+            spans = ", ".join(f"{start}-{end}" for start, end in focus_ranges)
+            focus = (f"\nOnly report issues on lines {spans} (1-based line numbers of the code below). "
+                     "The rest of the module was already reviewed; use it only as context.\n")
+
         prompt = f"""You are an expert Python code reviewer. Respond ONLY with a valid JSON array of review items.
 If no issues, return [].
 Each item must follow this schema exactly:
@@ -51,31 +89,26 @@ Python Code to Review:
 ```python
 {code}
 ```
-
+{focus}
 Provide a detailed code review."""
 
-        # Attempt to use 'gemini-pro-latest' first
-        model_name = 'gemini-pro-latest'
+        genai = get_genai()
         text = None
 
-        try:
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(prompt)
-            text = response.text.strip()
-            logger.info(f"Raw Gemini output using {model_name}: {text[:500]}")
-        except Exception as e:
-            logger.warning(f"Failed to use {model_name}: {e}")
-
-            # If 'gemini-pro-latest' fails, try 'gemini-pro' as a fallback
-            model_name = 'gemini-pro'
+        # Try each model in turn, falling back on failure
+        models = candidate_models()
+        for model_name in models:
             try:
                 model = genai.GenerativeModel(model_name)
                 response = model.generate_content(prompt)
                 text = response.text.strip()
                 logger.info(f"Raw Gemini output using {model_name}: {text[:500]}")
-            except Exception as e2:
-                logger.error(f"Failed to use {model_name} as fallback: {e2}")
-                raise e2
+                break
+            except Exception as e:
+                if model_name == models[-1]:
+                    logger.error(f"Failed to use {model_name} as fallback: {e}")
+                    raise
+                logger.warning(f"Failed to use {model_name}: {e}")
 
         # Clean up response text
         if text.startswith("```"):
@@ -106,12 +139,7 @@ Provide a detailed code review."""
                     "suggestion": item.get("suggestion", "No suggestion provided")
                 })
 
-        return validated_reviews if validated_reviews else [{
-            "category": "Info",
-            "line": "N/A",
-            "message": "No issues found",
-            "suggestion": "Code looks good!"
-        }]
+        return validated_reviews if validated_reviews else [dict(NO_ISSUES_FOUND)]
 
     except Exception as e:
         logger.exception("Gemini API error")
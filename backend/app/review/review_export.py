@@ -0,0 +1,173 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from auth.auth import GetCurrentUser
+from model.review_database import Reviews
+from Database import SQLALCHEMY_DATABASE_URL
+from datetime import datetime, timezone
+import csv
+import io
+import itertools
+import json
+import logging
+import os
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Accounts allowed to export other users' or the whole org's history (comma separated)
+EXPORT_ADMIN_EMAILS = {e.strip() for e in os.getenv("EXPORT_ADMIN_EMAILS", "").split(",") if e.strip()}
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+
+# Bytes buffered before a chunk is sent to the client
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_COLUMNS = ["id", "email", "created_at", "code", "static_result", "ai_result"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Exports run at most this many at a time, each on a connection from their own
+# pool, so long streams never take connections away from /review
+EXPORT_MAX_CONCURRENT = int(os.getenv("EXPORT_MAX_CONCURRENT", "2"))
+
+export_engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_pre_ping=True,
+    poolclass=QueuePool,
+    pool_size=EXPORT_MAX_CONCURRENT,
+    max_overflow=0
+)
+ExportSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=export_engine)
+
+_export_slots = threading.BoundedSemaphore(EXPORT_MAX_CONCURRENT)
+
+
+def iter_reviews(email: str | None, start: datetime | None, end: datetime | None):
+    """
+    Yield matching review rows from a server-side cursor.
+    Uses its own session so the stream outlives the request's dependencies.
+    """
+    db = ExportSessionLocal()
+    try:
+        query = db.query(*[getattr(Reviews, column) for column in EXPORT_COLUMNS])
+        if email:
+            query = query.filter(Reviews.email == email)
+        if start:
+            query = query.filter(Reviews.created_at >= start)
+        if end:
+            query = query.filter(Reviews.created_at < end)
+        # Plain column rows (no ORM objects) streamed in batches keep memory flat
+        for row in query.order_by(Reviews.id).yield_per(EXPORT_BATCH_SIZE):
+            yield row
+    finally:
+        db.close()
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Normalize a query bound to aware UTC; naive values are taken to be UTC already."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _as_dict(row) -> dict:
+    record = dict(zip(EXPORT_COLUMNS, row))
+    if record["created_at"] is not None:
+        record["created_at"] = record["created_at"].isoformat()
+    return record
+
+
+def encode_ndjson(rows):
+    for row in rows:
+        yield json.dumps(_as_dict(row)) + "\n"
+
+
+def encode_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        record = _as_dict(row)
+        writer.writerow([record[column] for column in EXPORT_COLUMNS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def chunked(lines, compress: bool):
+    """Group encoded lines into chunks, gzip-compressing them incrementally if requested."""
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31 -> gzip container
+    pending = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= EXPORT_CHUNK_SIZE:
+            chunk = b"".join(pending)
+            pending, size = [], 0
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+    chunk = b"".join(pending)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def _holding_slot(body):
+    """Release the export slot once the stream finishes, fails or is closed by a disconnect."""
+    try:
+        yield from body
+    finally:
+        _export_slots.release()
+
+
+@router.get("/reviews/export")
+def export_reviews(
+    format: str = Query("ndjson", description="ndjson or csv"),
+    email: str | None = Query(None, description="Only this user's reviews; admins may omit it to export everyone"),
+    start: datetime | None = Query(None, description="Reviews created at or after this time"),
+    end: datetime | None = Query(None, description="Reviews created before this time"),
+    compress: bool = Query(False, description="gzip-compress the export"),
+    current_user: str = Depends(GetCurrentUser)
+):
+    if format not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'csv'")
+    start, end = _as_utc(start), _as_utc(end)
+    if start and end and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    # Regular users can only export their own history
+    if current_user not in EXPORT_ADMIN_EMAILS:
+        if email and email != current_user:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to export other users' reviews")
+        email = current_user
+
+    if not _export_slots.acquire(blocking=False):
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many exports running, try again later")
+
+    logger.info(f"Export requested by {current_user} (email={email or 'all'}, format={format}, compress={compress})")
+
+    encode = encode_ndjson if format == "ndjson" else encode_csv
+    filename = f"reviews-export.{format}" + (".gz" if compress else "")
+    body = _holding_slot(chunked(encode(iter_reviews(email, start, end)), compress))
+    # Start the stream here so the slot is released even if the client never reads it
+    first = next(body, None)
+    # A sync generator is iterated in the threadpool, so the export never blocks the event loop
+    return StreamingResponse(
+        itertools.chain([first] if first else [], body),
+        media_type="application/gzip" if compress else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
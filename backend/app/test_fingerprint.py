@@ -0,0 +1,164 @@
+from review.fingerprint import fingerprint_code, similarity, remap_findings, changed_ranges, findings_in_ranges
+
+ORIGINAL = """import os
+import sys
+
+
+def add(x, y):
+    return x + y
+
+
+@decorator
+def greet(name):
+    # say hello
+    return f"Hello {name}"
+"""
+
+# Same structure: imports reordered, comments, blank lines and spacing changed
+REFORMATTED = """import sys
+import os
+# helpers
+
+
+def add( x,y ):
+    return x+y
+
+# greeting
+@decorator
+def greet(name):
+
+    return f"Hello {name}"
+"""
+
+# One function body changed
+EDITED = ORIGINAL.replace("return x + y", "return x - y")
+
+
+def test_formatting_comments_and_import_order_keep_module_hash():
+    assert fingerprint_code(ORIGINAL)["module_hash"] == fingerprint_code(REFORMATTED)["module_hash"]
+
+
+def test_code_change_changes_module_hash():
+    assert fingerprint_code(ORIGINAL)["module_hash"] != fingerprint_code(EDITED)["module_hash"]
+
+
+def test_invalid_code_has_no_fingerprint():
+    assert fingerprint_code("def broken(:\n") is None
+
+
+def test_partial_similarity():
+    old = fingerprint_code(ORIGINAL)["unit_hashes"]
+    new = fingerprint_code(EDITED)["unit_hashes"]
+    # os, sys and greet match; add changed
+    assert similarity(old, new) == 0.75
+    assert similarity(old, old) == 1.0
+    assert similarity(old, fingerprint_code("x = 1\n")["unit_hashes"]) == 0.0
+
+
+def test_remap_node_lines():
+    findings = [{"line": 6, "message": "add"}, {"line": "12", "message": "greet return"}]
+    assert remap_findings(findings, ORIGINAL, REFORMATTED) == [
+        {"line": 7, "message": "add"},
+        {"line": 13, "message": "greet return"},
+    ]
+
+
+def test_remap_comment_line_and_decorator():
+    findings = [{"line": 9, "message": "decorator"}, {"line": 11, "message": "comment"}]
+    # decorator 9 -> 10; the comment at 11 follows the def line (10 -> 11) and lands on 12
+    assert remap_findings(findings, ORIGINAL, REFORMATTED) == [
+        {"line": 10, "message": "decorator"},
+        {"line": 12, "message": "comment"},
+    ]
+
+
+def test_remap_collapsed_multiline_statement():
+    old = "import os\n\n\ndef f(a, b):\n    x = foo(\n        a,\n        b,\n    )\n    return x\n"
+    new = "import os\n\ndef f(a, b):\n    x = foo(a, b)\n    return x\n"
+    # Lines 5-8 are one statement, now on line 4; the return moves from 9 to 5
+    findings = [{"line": 5}, {"line": 7}, {"line": 8}, {"line": "5-8"}, {"line": 9}]
+    assert remap_findings(findings, old, new) == [
+        {"line": 4}, {"line": 4}, {"line": 4}, {"line": "4-4"}, {"line": 5}
+    ]
+
+
+def test_remap_line_range_and_non_line_values():
+    findings = [{"line": "10-12"}, {"line": "N/A"}]
+    assert remap_findings(findings, ORIGINAL, REFORMATTED) == [{"line": "11-13"}, {"line": "N/A"}]
+
+
+def test_remap_line_text_and_lists():
+    findings = [{"line": "Line 10"}, {"line": "6, 12"}]
+    assert remap_findings(findings, ORIGINAL, REFORMATTED) == [{"line": "Line 11"}, {"line": "7, 13"}]
+
+
+def test_remap_drops_line_text_pointing_into_changed_units():
+    findings = [{"line": "Line 6"}, {"line": "6, 12"}, {"line": "Line 12"}]
+    assert remap_findings(findings, ORIGINAL, EDITED) == [{"line": "Line 12"}]
+
+
+def test_remap_drops_findings_in_changed_units():
+    findings = [{"line": 6, "message": "in add"}, {"line": 12, "message": "in greet"}]
+    assert remap_findings(findings, ORIGINAL, EDITED) == [{"line": 12, "message": "in greet"}]
+
+
+def test_changed_ranges():
+    assert changed_ranges(ORIGINAL, EDITED) == [(5, 6)]
+    assert changed_ranges(ORIGINAL, REFORMATTED) == []
+    # A new decorated function is reported with its decorator line
+    assert changed_ranges(ORIGINAL, ORIGINAL + "\n\n@cache\ndef extra():\n    pass\n") == [(15, 17)]
+
+
+def test_findings_in_ranges_keeps_only_changed_lines():
+    fresh = [
+        {"line": 6, "message": "in add"},
+        {"line": "5-6", "message": "add range"},
+        {"line": 1, "message": "import outside the changed unit"},
+        {"line": "6, 12", "message": "spans into greet"},
+        {"line": "N/A", "message": "general"},
+    ]
+    assert findings_in_ranges(fresh, changed_ranges(ORIGINAL, EDITED)) == [
+        {"line": 6, "message": "in add"},
+        {"line": "5-6", "message": "add range"},
+        {"line": "N/A", "message": "general"},
+    ]
+
+
+def _store(db, code, ai_result):
+    from model.review_database import Reviews
+    from model.review_setting import add_fingerprint
+
+    review = Reviews(email="user@example.com", code=code, static_result="", ai_result=str(ai_result))
+    db.add(review)
+    db.flush()
+    add_fingerprint(db, review.id, "user@example.com", fingerprint_code(code))
+    db.commit()
+    return review
+
+
+def test_find_reusable_review_skips_failed_reviews(db):
+    from model.review_setting import find_reusable_review
+
+    good = _store(db, ORIGINAL, [{"category": "Style", "line": 6, "message": "m", "suggestion": "s"}])
+    _store(db, ORIGINAL, [{"category": "Error", "line": "N/A", "message": "AI Review failed", "suggestion": "s"}])
+
+    review, findings, score = find_reusable_review(db, "user@example.com", fingerprint_code(REFORMATTED), 1.0, 50)
+    assert review.id == good.id
+    assert findings[0]["category"] == "Style"
+    assert score == 1.0
+
+
+def test_find_reusable_review_none_when_only_failed_reviews(db):
+    from model.review_setting import find_reusable_review
+
+    _store(db, ORIGINAL, [{"category": "Error", "line": "N/A", "message": "AI Review failed", "suggestion": "s"}])
+    assert find_reusable_review(db, "user@example.com", fingerprint_code(ORIGINAL), 1.0, 50) is None
+
+
+def test_find_reusable_review_respects_threshold(db):
+    from model.review_setting import find_reusable_review
+
+    _store(db, ORIGINAL, [])
+    assert find_reusable_review(db, "user@example.com", fingerprint_code(EDITED), 1.0, 50) is None
+    assert find_reusable_review(db, "user@example.com", fingerprint_code(EDITED), 0.75, 50)[2] == 0.75
+    assert find_reusable_review(db, "other@example.com", fingerprint_code(ORIGINAL), 1.0, 50) is None
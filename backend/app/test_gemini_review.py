@@ -0,0 +1,50 @@
+import json
+from review import gemini_review
+
+CODE = """import os
+
+def add(x, y):
+    return x - y
+"""
+
+
+class FakeModel:
+    prompts = []
+
+    def __init__(self, name):
+        self.name = name
+
+    def generate_content(self, prompt):
+        FakeModel.prompts.append(prompt)
+        text = json.dumps([{"category": "Bug", "line": 4, "message": "m", "suggestion": "s"}])
+        return type("Response", (), {"text": text})()
+
+
+class FakeGenai:
+    GenerativeModel = FakeModel
+
+
+def test_focused_review_sends_whole_module_and_static_results(monkeypatch):
+    FakeModel.prompts = []
+    monkeypatch.setattr(gemini_review, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini_review, "get_genai", lambda: FakeGenai)
+    monkeypatch.setattr(gemini_review, "candidate_models", lambda: ["fake-model"])
+
+    result = gemini_review.gemini_code_review(CODE, "t.py:4:5: F821 undefined name", [(3, 4)])
+
+    assert result == [{"category": "Bug", "line": 4, "message": "m", "suggestion": "s"}]
+    prompt = FakeModel.prompts[0]
+    assert CODE in prompt
+    assert "F821 undefined name" in prompt
+    assert "Only report issues on lines 3-4" in prompt
+
+
+def test_full_review_has_no_focus(monkeypatch):
+    FakeModel.prompts = []
+    monkeypatch.setattr(gemini_review, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini_review, "get_genai", lambda: FakeGenai)
+    monkeypatch.setattr(gemini_review, "candidate_models", lambda: ["fake-model"])
+
+    gemini_review.gemini_code_review(CODE)
+
+    assert "Only report issues" not in FakeModel.prompts[0]
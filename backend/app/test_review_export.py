@@ -0,0 +1,107 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from auth.auth import GetCurrentUser  # noqa: E402
+from model.review_database import Reviews  # noqa: E402
+from review import review_export  # noqa: E402
+
+ADMIN = "admin@example.com"
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    monkeypatch.setattr(review_export, "EXPORT_ADMIN_EMAILS", {ADMIN})
+    app = FastAPI()
+    app.include_router(review_export.router)
+    app.state.current_user = "alice@example.com"
+    app.dependency_overrides[GetCurrentUser] = lambda: app.state.current_user
+
+    db.add_all([
+        Reviews(email="alice@example.com", code="a = 1", static_result="", ai_result="[]",
+                created_at=datetime(2024, 1, 15)),
+        Reviews(email="alice@example.com", code="a = 2", static_result="", ai_result="[]",
+                created_at=datetime(2024, 3, 15)),
+        Reviews(email="bob@example.com", code="b = 1", static_result="", ai_result="[]",
+                created_at=datetime(2024, 2, 15)),
+    ])
+    db.commit()
+    return TestClient(app)
+
+
+def test_ndjson_export(client):
+    response = client.get("/reviews/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["code"] for r in records] == ["a = 1", "a = 2"]
+    assert {r["email"] for r in records} == {"alice@example.com"}
+
+
+def test_csv_export(client):
+    response = client.get("/reviews/export", params={"format": "csv"})
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == review_export.EXPORT_COLUMNS
+    assert [row[3] for row in rows[1:]] == ["a = 1", "a = 2"]
+
+
+def test_csv_export_of_empty_result_has_header_only(client):
+    response = client.get("/reviews/export", params={"format": "csv", "start": "2030-01-01T00:00:00"})
+    assert response.status_code == 200
+    assert list(csv.reader(io.StringIO(response.text))) == [review_export.EXPORT_COLUMNS]
+
+
+def test_gzip_export(client):
+    response = client.get("/reviews/export", params={"compress": "true"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"].endswith('reviews-export.ndjson.gz"')
+    lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+    assert len(lines) == 2
+
+
+def test_non_admin_cannot_export_other_users(client):
+    response = client.get("/reviews/export", params={"email": "bob@example.com"})
+    assert response.status_code == 403
+
+
+def test_admin_exports_all_users(client):
+    client.app.state.current_user = ADMIN
+    response = client.get("/reviews/export")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert {r["email"] for r in records} == {"alice@example.com", "bob@example.com"}
+
+    response = client.get("/reviews/export", params={"email": "bob@example.com"})
+    assert [json.loads(line)["code"] for line in response.text.splitlines()] == ["b = 1"]
+
+
+def test_date_range_filter(client):
+    client.app.state.current_user = ADMIN
+    response = client.get("/reviews/export", params={"start": "2024-02-01T00:00:00", "end": "2024-03-01T00:00:00"})
+    assert [json.loads(line)["code"] for line in response.text.splitlines()] == ["b = 1"]
+
+
+def test_mixed_timezone_bounds(client):
+    response = client.get("/reviews/export", params={"start": "2020-01-01T00:00:00Z", "end": "2030-01-01T00:00:00"})
+    assert response.status_code == 200
+    response = client.get("/reviews/export", params={"start": "2030-01-01T00:00:00Z", "end": "2020-01-01T00:00:00"})
+    assert response.status_code == 400
+
+
+def test_concurrent_export_limit(client, monkeypatch):
+    monkeypatch.setattr(review_export, "_export_slots", review_export.threading.BoundedSemaphore(1))
+    review_export._export_slots.acquire()
+    assert client.get("/reviews/export").status_code == 429
+    review_export._export_slots.release()
+    assert client.get("/reviews/export").status_code == 200
+    # The slot is given back once the stream completes
+    assert client.get("/reviews/export").status_code == 200
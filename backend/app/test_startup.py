@@ -0,0 +1,84 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import pytest
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Budget for `import main` in milliseconds; override for slow CI machines
+IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500"))
+
+# Modules that must only be imported on first use, not at startup
+LAZY_MODULES = ["google.generativeai"]
+
+
+def import_times(module: str) -> dict:
+    """Import a module in a fresh interpreter with -X importtime; returns {name: cumulative_us}."""
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    env.setdefault("GEMINI_API_KEY", "test-key")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        times[parts[2].strip()] = int(parts[1].strip())
+    return times
+
+
+def test_main_import_within_budget():
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    times = import_times("main")
+    elapsed_ms = times["main"] / 1000
+    assert elapsed_ms < IMPORT_BUDGET_MS, f"import main took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+
+
+def test_heavy_modules_are_lazy():
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    # Without the SDK installed there is nothing that could be imported eagerly
+    for name in LAZY_MODULES:
+        pytest.importorskip(name)
+    times = import_times("main")
+    for name in LAZY_MODULES:
+        assert name not in times, f"{name} is imported at startup"
+
+
+def test_init_schema_creates_tables(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("dotenv")
+    db_path = tmp_path / "schema.db"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}")
+    result = subprocess.run(
+        [sys.executable, "init_schema.py"],
+        cwd=APP_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    with sqlite3.connect(db_path) as conn:
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"accounts", "reviews", "review_fingerprints"} <= tables
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
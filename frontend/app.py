@@ -74,6 +74,8 @@ def review_code(file_obj):
             ai_review = result.get('ai_review') or result.get('ai_result') or result.get('gemini_review')
             if ai_review:
                 output_lines.append("### 🤖 AI Analysis")
+                if result.get('ai_reused'):
+                    output_lines.append(f"_Findings reused from review #{result.get('reused_from_review_id')} (structurally matching upload)._")
                 if isinstance(ai_review, (list, dict)):
                     output_lines.append("```json\n" + json.dumps(ai_review, indent=2) + "\n```")
                 else: